@@ -3,10 +3,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import TYPE_CHECKING
 
 import numpy as np
+from ase.calculators.calculator import FileIOCalculator
+from ase.calculators.vasp import Vasp
 from ase.io.jsonio import encode
 from pymatgen.io.ase import AseAtomsAdaptor
 
@@ -15,6 +17,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_FILE_BASED_CALCULATORS = (FileIOCalculator, Vasp)
+
 
 def get_atoms_id(atoms: Atoms) -> str:
     """
@@ -70,7 +74,7 @@ def check_is_metal(atoms: Atoms) -> bool:
     return all(k.is_metal for k in struct.composition)
 
 
-def copy_atoms(atoms: Atoms) -> Atoms:
+def copy_atoms(atoms: Atoms, deep_copy_calc: bool = True) -> Atoms:
     """
     Simple function to copy an atoms object to prevent mutability.
 
@@ -78,12 +82,32 @@ def copy_atoms(atoms: Atoms) -> Atoms:
     ----------
     atoms
         Atoms object
+    deep_copy_calc
+        Whether the attached calculator should be deep-copied along with the
+        Atoms object. If False and the calculator is file-based (i.e. it
+        rebuilds its state from its output files on every calculation, like
+        VASP), the Atoms object is copied with `atoms.copy()` and a shallow
+        copy of the calculator is attached instead. Its dictionaries, lists,
+        and arrays (e.g. `results` and the input parameters) are still
+        deep-copied, so neither calculator can modify the other. This is much
+        cheaper for large systems since the rest of the calculator's internal
+        state is not traversed. Other calculators are always deep-copied.
 
     Returns
     -------
     atoms
         Atoms object
     """
+    if not deep_copy_calc and isinstance(atoms.calc, _FILE_BASED_CALCULATORS):
+        calc = copy(atoms.calc)
+        atoms = atoms.copy()
+        calc_dict = vars(calc)
+        for k, v in calc_dict.items():
+            if isinstance(v, (dict, list, np.ndarray)):
+                calc_dict[k] = deepcopy(v)
+        atoms.calc = calc
+        return atoms
+
     try:
         atoms = deepcopy(atoms)
     except Exception:
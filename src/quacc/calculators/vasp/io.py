@@ -1,14 +1,21 @@
 """I/O utilities for the Vasp calculator."""
 from __future__ import annotations
 
+from copy import deepcopy
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from quacc.utils.files import load_yaml_calc
+import yaml
+
+from quacc.utils.files import SafeLoader, load_yaml_calc
 
 if TYPE_CHECKING:
-    from pathlib import Path
     from typing import Any
 
+# Parsed VASP YAML files, keyed by their resolved path. Each entry holds the
+# modification times of the YAML file and its parents alongside the configuration.
+_VASP_YAML_CACHE: dict[Path, tuple[dict[Path, int | None], dict[str, Any]]] = {}
+
 
 def load_vasp_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
     """
@@ -28,6 +35,10 @@ def load_vasp_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
     dictionary of ASE-style pseudopotentials, and and `elemental_magmoms` is a
     dictionary of element-wise initial magmoms.
 
+    The parsed configuration is cached based on the resolved path and the
+    modification times of the YAML file and any of its parent YAML files, so
+    repeated calls with the same (unchanged) files do not re-parse them.
+
     Parameters
     ----------
     yaml_path
@@ -40,7 +51,32 @@ def load_vasp_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
     dict
         The calculator configuration (i.e. settings).
     """
+    yaml_path = Path(yaml_path).with_suffix(".yaml").resolve()
+
+    cached = _VASP_YAML_CACHE.get(yaml_path)
+    if cached is None or any(_get_mtime(f) != mtime for f, mtime in cached[0].items()):
+        mtimes = {f: _get_mtime(f) for f in _get_yaml_files(yaml_path)}
+        cached = (mtimes, _load_vasp_yaml_calc(yaml_path))
+        _VASP_YAML_CACHE[yaml_path] = cached
+
+    # Return a copy so that the cached configuration cannot be mutated
+    return deepcopy(cached[1])
+
 
+def _load_vasp_yaml_calc(yaml_path: Path) -> dict[str, Any]:
+    """
+    Uncached YAML loader used by `load_vasp_yaml_calc`.
+
+    Parameters
+    ----------
+    yaml_path
+        Path to the YAML file.
+
+    Returns
+    -------
+    dict
+        The calculator configuration (i.e. settings).
+    """
     config = load_yaml_calc(yaml_path)
 
     # Allow for either "Cu_pv" and "_pv" style setups
@@ -54,3 +90,50 @@ def load_vasp_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
                 config["inputs"]["setups"][k] = v.split(k)[-1]
 
     return config
+
+
+def _get_yaml_files(yaml_path: Path) -> list[Path]:
+    """
+    Get a YAML file and all of the parent YAML files it inherits from, following
+    the same "parent" convention as `quacc.utils.files.load_yaml_calc`.
+
+    Parameters
+    ----------
+    yaml_path
+        Path to the YAML file.
+
+    Returns
+    -------
+    list[Path]
+        The YAML file followed by its parent YAML files.
+    """
+    yaml_files = [yaml_path]
+    if not yaml_path.exists():
+        return yaml_files
+
+    with yaml_path.open() as stream:
+        config = yaml.load(stream, Loader=SafeLoader) or {}
+
+    for config_arg, value in config.items():
+        if "parent" in config_arg.lower():
+            yaml_parent_path = (yaml_path.parent / Path(value)).with_suffix(".yaml")
+            yaml_files.extend(_get_yaml_files(yaml_parent_path.resolve()))
+
+    return yaml_files
+
+
+def _get_mtime(path: Path) -> int | None:
+    """
+    Get the modification time of a file.
+
+    Parameters
+    ----------
+    path
+        Path to the file.
+
+    Returns
+    -------
+    int | None
+        The modification time in nanoseconds, or None if the file does not exist.
+    """
+    return path.stat().st_mtime_ns if path.exists() else None
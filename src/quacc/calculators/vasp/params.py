@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -16,6 +17,7 @@ if TYPE_CHECKING:
     from typing import Any, Literal
 
     from ase.atoms import Atoms
+    from pymatgen.core import Structure
 
 logger = logging.getLogger(__name__)
 
@@ -353,11 +355,10 @@ def convert_auto_kpts(
         max_pmg_kpts = None
         for k, v in auto_kpts.items():
             if k == "kppvol":
-                pmg_kpts = Kpoints.automatic_density_by_vol(
-                    struct, v, force_gamma=force_gamma
-                )
+                kppa = v * struct.lattice.reciprocal_lattice.volume * len(struct)
+                pmg_kpts = _automatic_density(struct, kppa, force_gamma=force_gamma)
             elif k == "kppa":
-                pmg_kpts = Kpoints.automatic_density(struct, v, force_gamma=force_gamma)
+                pmg_kpts = _automatic_density(struct, v, force_gamma=force_gamma)
             elif k == "length_densities":
                 pmg_kpts = Kpoints.automatic_density_by_lengths(
                     struct, v, force_gamma=force_gamma
@@ -385,3 +386,51 @@ def convert_auto_kpts(
         user_calc_params["gamma"] = gamma
 
     return user_calc_params
+
+
+def _automatic_density(
+    struct: Structure, kppa: float, force_gamma: bool = False
+) -> Kpoints:
+    """
+    Returns the same k-point grid as
+    `pymatgen.io.vasp.inputs.Kpoints.automatic_density` but only carries out
+    the (costly) symmetry analysis of the structure if it is needed to choose
+    between a Gamma-centered and Monkhorst-Pack grid. For large cells, where
+    the grid often has an odd number of divisions, this avoids a space group
+    determination entirely.
+
+    Parameters
+    ----------
+    struct
+        The input structure.
+    kppa
+        The grid density (number of k-points per reciprocal atom).
+    force_gamma
+        Whether to force a Gamma-centered grid.
+
+    Returns
+    -------
+    Kpoints
+        The pymatgen Kpoints object.
+    """
+    comment = f"pymatgen with grid density = {kppa:.0f} / number of atoms"
+    if math.fabs((math.floor(kppa ** (1 / 3) + 0.5)) ** 3 - kppa) < 1:
+        kppa += kppa * 0.01
+    lengths = struct.lattice.abc
+    ngrid = kppa / len(struct)
+    mult = (ngrid * lengths[0] * lengths[1] * lengths[2]) ** (1 / 3)
+    num_div = [math.floor(max(mult / length, 1)) for length in lengths]
+
+    use_gamma = (
+        force_gamma
+        or any(n % 2 == 1 for n in num_div)
+        or struct.lattice.is_hexagonal()
+        or struct.get_space_group_info()[0][0] == "F"
+    )
+    style = (
+        Kpoints.supported_modes.Gamma
+        if use_gamma
+        else Kpoints.supported_modes.Monkhorst
+    )
+
+    return Kpoints(comment, 0, style, [num_div], (0, 0, 0))
@@ -25,6 +25,7 @@ if TYPE_CHECKING:
     from typing import Literal
 
     from ase.atoms import Atoms
+    from numpy.typing import ArrayLike
 
 
 class Vasp(Vasp_):
@@ -201,7 +202,7 @@ class Vasp(Vasp_):
         # Return vanilla ASE command
         vasp_cmd = (
             SETTINGS.VASP_GAMMA_CMD
-            if np.prod(self.user_calc_params.get("kpts", [1, 1, 1])) == 1
+            if _is_gamma_only(self.user_calc_params.get("kpts", [1, 1, 1]))
             else SETTINGS.VASP_CMD
         )
 
@@ -294,3 +295,21 @@ class Vasp(Vasp_):
 
         # Remove unused INCAR flags
         self.user_calc_params = remove_unused_flags(self.user_calc_params)
+
+
+def _is_gamma_only(kpts: ArrayLike) -> bool:
+    """
+    Determine whether a k-point specification is a Gamma-only 1x1x1 mesh.
+
+    Parameters
+    ----------
+    kpts
+        The kpts kwarg, either a k-point mesh or an explicit list of k-points.
+
+    Returns
+    -------
+    bool
+        Whether only the Gamma point is sampled.
+    """
+    kpts = np.asarray(kpts)
+    return kpts.shape == (3,) and bool(np.all(kpts == 1))
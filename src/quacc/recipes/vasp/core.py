@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from quacc import job
@@ -14,6 +15,31 @@ if TYPE_CHECKING:
 
     from quacc.schemas._aliases.vasp import DoubleRelaxSchema, VaspSchema
 
+_STATIC_DEFAULTS = MappingProxyType(
+    {
+        "ismear": -5,
+        "laechg": True,
+        "lcharg": True,
+        "lreal": False,
+        "lwave": True,
+        "nedos": 5001,
+        "nsw": 0,
+    }
+)
+_RELAX_DEFAULTS = MappingProxyType(
+    {
+        "ediffg": -0.02,
+        "ibrion": 2,
+        "isym": 0,
+        "lcharg": False,
+        "lwave": False,
+        "nsw": 200,
+        "symprec": 1e-8,
+    }
+)
+_RELAX_CELL_DEFAULTS = MappingProxyType(_RELAX_DEFAULTS | {"isif": 3})
+_RELAX_POSITIONS_DEFAULTS = MappingProxyType(_RELAX_DEFAULTS | {"isif": 2})
+
 
 @job
 def static_job(
@@ -44,19 +70,10 @@ def static_job(
         Dictionary of results from [quacc.schemas.vasp.vasp_summarize_run][]
     """
 
-    calc_defaults = {
-        "ismear": -5,
-        "laechg": True,
-        "lcharg": True,
-        "lreal": False,
-        "lwave": True,
-        "nedos": 5001,
-        "nsw": 0,
-    }
     return base_fn(
         atoms,
         preset=preset,
-        calc_defaults=calc_defaults,
+        calc_defaults=_STATIC_DEFAULTS,
         calc_swaps=calc_kwargs,
         additional_fields={"name": "VASP Static"},
         copy_files=copy_files,
@@ -96,16 +113,7 @@ def relax_job(
         Dictionary of results from [quacc.schemas.vasp.vasp_summarize_run][]
     """
 
-    calc_defaults = {
-        "ediffg": -0.02,
-        "isif": 3 if relax_cell else 2,
-        "ibrion": 2,
-        "isym": 0,
-        "lcharg": False,
-        "lwave": False,
-        "nsw": 200,
-        "symprec": 1e-8,
-    }
+    calc_defaults = _RELAX_CELL_DEFAULTS if relax_cell else _RELAX_POSITIONS_DEFAULTS
     return base_fn(
         atoms,
         preset=preset,
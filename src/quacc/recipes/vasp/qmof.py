@@ -6,14 +6,17 @@ Reference: https://doi.org/10.1016/j.matt.2021.02.015
 """
 from __future__ import annotations
 
+from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from ase.optimize import BFGSLineSearch
 
-from quacc import job
+from quacc import flow, job
 from quacc.calculators.vasp import Vasp
 from quacc.recipes.vasp._base import base_fn
 from quacc.runners.ase import run_opt
+from quacc.runners.prep import defer_gzip
 from quacc.schemas.ase import summarize_opt_run
 from quacc.utils.dicts import merge_dicts
 
@@ -23,6 +26,57 @@ if TYPE_CHECKING:
     from quacc.schemas._aliases.ase import OptSchema
     from quacc.schemas._aliases.vasp import QMOFRelaxSchema, VaspSchema
 
+_PRERELAX_DEFAULTS = MappingProxyType(
+    {
+        "auto_kpts": {"kppa": 100},
+        "ediff": 1e-4,
+        "encut": None,
+        "lcharg": False,
+        "lreal": "auto",
+        "lwave": True,
+        "nelm": 225,
+        "nsw": 0,
+    }
+)
+_LOOSE_RELAX_POSITIONS_DEFAULTS = MappingProxyType(
+    {
+        "auto_kpts": {"kppa": 100},
+        "ediff": 1e-4,
+        "ediffg": -0.05,
+        "encut": None,
+        "ibrion": 2,
+        "isif": 2,
+        "lcharg": False,
+        "lreal": "auto",
+        "lwave": True,
+        "nsw": 250,
+    }
+)
+_LOOSE_RELAX_CELL_DEFAULTS = MappingProxyType(
+    {
+        "auto_kpts": {"kppa": 100},
+        "ediffg": -0.03,
+        "ibrion": 2,
+        "isif": 3,
+        "lcharg": False,
+        "lreal": "auto",
+        "lwave": True,
+        "nsw": 500,
+    }
+)
+_DOUBLE_RELAX_DEFAULTS = MappingProxyType(
+    {"ediffg": -0.03, "ibrion": 2, "lcharg": False, "lreal": "auto", "lwave": True}
+)
+_DOUBLE_RELAX_CELL_DEFAULTS = MappingProxyType(
+    _DOUBLE_RELAX_DEFAULTS | {"isif": 3, "nsw": 500}
+)
+_DOUBLE_RELAX_POSITIONS_DEFAULTS = MappingProxyType(
+    _DOUBLE_RELAX_DEFAULTS | {"isif": 2, "nsw": 250}
+)
+_STATIC_DEFAULTS = MappingProxyType(
+    {"laechg": True, "lcharg": True, "lreal": False, "lwave": True, "nsw": 0}
+)
+
 
 @job
 def qmof_relax_job(
@@ -70,6 +124,94 @@ def qmof_relax_job(
         Dictionary of results
     """
 
+    # The WAVECAR is handed from one step to the next, so we only gzip the
+    # files once all the calculations are complete.
+    with defer_gzip():
+        # 1. Pre-relaxation
+        if run_prerelax:
+            summary1 = _prerelax.__wrapped__(atoms, preset, fmax=5.0, **calc_kwargs)
+            atoms = summary1["atoms"]
+
+        # 2. Position relaxation (loose)
+        summary2 = _loose_relax_positions.__wrapped__(atoms, preset, **calc_kwargs)
+        atoms = summary2["atoms"]
+
+        # 3. Optional: Volume relaxation (loose)
+        if relax_cell:
+            summary3 = _loose_relax_cell.__wrapped__(
+                atoms, preset, copy_files=["WAVECAR"], **calc_kwargs
+            )
+            atoms = summary3["atoms"]
+
+        # 4. Double Relaxation This is done for two reasons: a) because it can
+        # resolve repadding issues when dV is large; b) because we can use LREAL =
+        # Auto for the first relaxation and the default LREAL for the second.
+        summary4 = _double_relax.__wrapped__(
+            atoms, preset, relax_cell=relax_cell, copy_files=["WAVECAR"], **calc_kwargs
+        )
+        atoms = summary4[1]["atoms"]
+
+        # 5. Static Calculation
+        summary5 = _static.__wrapped__(
+            atoms, preset, copy_files=["WAVECAR"], **calc_kwargs
+        )
+
+    summary5["prerelax_lowacc"] = summary1 if run_prerelax else None
+    summary5["position_relax_lowacc"] = summary2
+    summary5["volume_relax_lowacc"] = summary3 if relax_cell else None
+    summary5["double_relax"] = summary4
+
+    return summary5
+
+
+@flow
+def qmof_relax_flow(
+    atoms: Atoms,
+    preset: str | None = "QMOFSet",
+    relax_cell: bool = True,
+    run_prerelax: bool = True,
+    **calc_kwargs,
+) -> QMOFRelaxSchema:
+    """
+    Workflow version of [quacc.recipes.vasp.qmof.qmof_relax_job][], where each
+    step is run as its own compute job. This allows the workflow engine to
+    schedule (and restart) the steps independently, at the cost of having to
+    hand off the WAVECAR between job directories. Settings are such that they
+    are compatible with the QMOF Database.
+
+    1. A "pre-relaxation" with BFGSLineSearch to resolve very high forces.
+
+    2. Position relaxation with default ENCUT and coarse k-point grid.
+
+    3. Optional: volume relaxation with coarse k-point grid.
+
+    4. Double relaxation using production-quality settings.
+
+    5. Static calculation.
+
+    Parameters
+    ----------
+    atoms
+        Atoms object
+    preset
+        Preset to use from `quacc.calculators.vasp.presets`. Applies for all jobs.
+    relax_cell
+        True if a volume relaxation should be performed. False if only the
+        positions should be updated.
+    run_prerelax
+        If True, a pre-relax will be carried out with BFGSLineSearch.
+        Recommended if starting from hypothetical structures or materials with
+        very high starting forces.
+    **kwargs
+        Custom kwargs for the calculator. Set a value to `None` to remove
+        a pre-existing key entirely. Applies for all jobs.
+
+    Returns
+    -------
+    QMOFRelaxSchema
+        Dictionary of results
+    """
+
     # 1. Pre-relaxation
     if run_prerelax:
         summary1 = _prerelax(atoms, preset, fmax=5.0, **calc_kwargs)
@@ -77,21 +219,35 @@ def qmof_relax_job(
 
     # 2. Position relaxation (loose)
     summary2 = _loose_relax_positions(atoms, preset, **calc_kwargs)
-    atoms = summary2["atoms"]
+    prev_summary = summary2
 
     # 3. Optional: Volume relaxation (loose)
     if relax_cell:
-        summary3 = _loose_relax_cell(atoms, preset, **calc_kwargs)
-        atoms = summary3["atoms"]
-
-    # 4. Double Relaxation This is done for two reasons: a) because it can
-    # resolve repadding issues when dV is large; b) because we can use LREAL =
-    # Auto for the first relaxation and the default LREAL for the second.
-    summary4 = _double_relax(atoms, preset, relax_cell=relax_cell, **calc_kwargs)
-    atoms = summary4[1]["atoms"]
+        summary3 = _loose_relax_cell(
+            prev_summary["atoms"],
+            preset,
+            copy_files=[Path(prev_summary["dir_name"]) / "WAVECAR"],
+            **calc_kwargs,
+        )
+        prev_summary = summary3
+
+    # 4. Double Relaxation
+    summary4 = _double_relax(
+        prev_summary["atoms"],
+        preset,
+        relax_cell=relax_cell,
+        copy_files=[Path(prev_summary["dir_name"]) / "WAVECAR"],
+        **calc_kwargs,
+    )
 
     # 5. Static Calculation
-    summary5 = _static(atoms, preset, **calc_kwargs)
+    summary5 = _static(
+        summary4[1]["atoms"],
+        preset,
+        copy_files=[Path(summary4[1]["dir_name"]) / "WAVECAR"],
+        **calc_kwargs,
+    )
+
     summary5["prerelax_lowacc"] = summary1 if run_prerelax else None
     summary5["position_relax_lowacc"] = summary2
     summary5["volume_relax_lowacc"] = summary3 if relax_cell else None
@@ -100,6 +256,7 @@ def qmof_relax_job(
     return summary5
 
 
+@job
 def _prerelax(
     atoms: Atoms, preset: str | None = "QMOFSet", fmax: float = 5.0, **calc_kwargs
 ) -> OptSchema:
@@ -123,23 +280,14 @@ def _prerelax(
         Dictionary of results from quacc.schemas.ase.summarize_opt_run
     """
 
-    calc_defaults = {
-        "auto_kpts": {"kppa": 100},
-        "ediff": 1e-4,
-        "encut": None,
-        "lcharg": False,
-        "lreal": "auto",
-        "lwave": True,
-        "nelm": 225,
-        "nsw": 0,
-    }
-    calc_flags = merge_dicts(calc_defaults, calc_kwargs, remove_nones=False)
+    calc_flags = merge_dicts(_PRERELAX_DEFAULTS, calc_kwargs, remove_nones=False)
     atoms.calc = Vasp(atoms, preset=preset, **calc_flags)
     dyn = run_opt(atoms, fmax=fmax, optimizer=BFGSLineSearch)
 
     return summarize_opt_run(dyn, additional_fields={"name": "QMOF Prerelax"})
 
 
+@job
 def _loose_relax_positions(
     atoms: Atoms, preset: str | None = "QMOFSet", **calc_kwargs
 ) -> VaspSchema:
@@ -162,29 +310,21 @@ def _loose_relax_positions(
         Dictionary of results from quacc.schemas.vasp.vasp_summarize_run
     """
 
-    calc_defaults = {
-        "auto_kpts": {"kppa": 100},
-        "ediff": 1e-4,
-        "ediffg": -0.05,
-        "encut": None,
-        "ibrion": 2,
-        "isif": 2,
-        "lcharg": False,
-        "lreal": "auto",
-        "lwave": True,
-        "nsw": 250,
-    }
     return base_fn(
         atoms,
         preset=preset,
-        calc_defaults=calc_defaults,
+        calc_defaults=_LOOSE_RELAX_POSITIONS_DEFAULTS,
         calc_swaps=calc_kwargs,
         additional_fields={"name": "QMOF Loose Relax"},
     )
 
 
+@job
 def _loose_relax_cell(
-    atoms: Atoms, preset: str | None = "QMOFSet", **calc_kwargs
+    atoms: Atoms,
+    preset: str | None = "QMOFSet",
+    copy_files: list[str] | None = None,
+    **calc_kwargs,
 ) -> VaspSchema:
     """
     Volume relaxation with coarse k-point grid.
@@ -195,6 +335,8 @@ def _loose_relax_cell(
         Atoms object
     preset
         Preset to use from `quacc.calculators.vasp.presets`.
+    copy_files
+        Files to copy to the runtime directory.
     **calc_kwargs
         Custom kwargs for the calculator. Set a value to `None` to remove
         a pre-existing key entirely.
@@ -205,28 +347,23 @@ def _loose_relax_cell(
         Dictionary of results from quacc.schemas.vasp.vasp_summarize_run
     """
 
-    calc_defaults = {
-        "auto_kpts": {"kppa": 100},
-        "ediffg": -0.03,
-        "ibrion": 2,
-        "isif": 3,
-        "lcharg": False,
-        "lreal": "auto",
-        "lwave": True,
-        "nsw": 500,
-    }
     return base_fn(
         atoms,
         preset=preset,
-        calc_defaults=calc_defaults,
+        calc_defaults=_LOOSE_RELAX_CELL_DEFAULTS,
         calc_swaps=calc_kwargs,
         additional_fields={"name": "QMOF Loose Relax Volume"},
-        copy_files=["WAVECAR"],
+        copy_files=copy_files,
     )
 
 
+@job
 def _double_relax(
-    atoms: Atoms, preset: str | None = "QMOFSet", relax_cell: bool = True, **calc_kwargs
+    atoms: Atoms,
+    preset: str | None = "QMOFSet",
+    relax_cell: bool = True,
+    copy_files: list[str] | None = None,
+    **calc_kwargs,
 ) -> list[VaspSchema]:
     """
     Double relaxation using production-quality settings.
@@ -239,6 +376,8 @@ def _double_relax(
         Preset to use from `quacc.calculators.vasp.presets`.
     relax_cell
         True if a volume relaxation should be performed.
+    copy_files
+        Files to copy to the runtime directory.
     **calc_kwargs
         Dictionary of custom kwargs for the calculator. Set a value to `None` to remove
         a pre-existing key entirely.
@@ -249,29 +388,23 @@ def _double_relax(
     """
 
     # Run first relaxation
-    calc_defaults = {
-        "ediffg": -0.03,
-        "ibrion": 2,
-        "isif": 3 if relax_cell else 2,
-        "lcharg": False,
-        "lreal": "auto",
-        "lwave": True,
-        "nsw": 500 if relax_cell else 250,
-    }
+    calc_defaults = (
+        _DOUBLE_RELAX_CELL_DEFAULTS if relax_cell else _DOUBLE_RELAX_POSITIONS_DEFAULTS
+    )
     summary1 = base_fn(
         atoms,
         preset=preset,
         calc_defaults=calc_defaults,
         calc_swaps=calc_kwargs,
         additional_fields={"name": "QMOF DoubleRelax 1"},
-        copy_files=["WAVECAR"],
+        copy_files=copy_files,
     )
 
     # Update atoms for Relaxation 2
     atoms = summary1["atoms"]
 
     # Reset LREAL
-    del calc_defaults["lreal"]
+    calc_defaults = {k: v for k, v in calc_defaults.items() if k != "lreal"}
 
     # Run second relaxation
     summary2 = base_fn(
@@ -285,7 +418,13 @@ def _double_relax(
     return [summary1, summary2]
 
 
-def _static(atoms: Atoms, preset: str | None = "QMOFSet", **calc_kwargs) -> VaspSchema:
+@job
+def _static(
+    atoms: Atoms,
+    preset: str | None = "QMOFSet",
+    copy_files: list[str] | None = None,
+    **calc_kwargs,
+) -> VaspSchema:
     """
     Static calculation using production-quality settings.
 
@@ -295,6 +434,8 @@ def _static(atoms: Atoms, preset: str | None = "QMOFSet", **calc_kwargs) -> Vasp
         Atoms object
     preset
         Preset to use from `quacc.calculators.presets.vasp`.
+    copy_files
+        Files to copy to the runtime directory.
     **kwargs
         Custom kwargs for the calculator. Set a value to `None` to remove
         a pre-existing key entirely.
@@ -305,18 +446,11 @@ def _static(atoms: Atoms, preset: str | None = "QMOFSet", **calc_kwargs) -> Vasp
         Dictionary of results from quacc.schemas.vasp.vasp_summarize_run
     """
 
-    calc_defaults = {
-        "laechg": True,
-        "lcharg": True,
-        "lreal": False,
-        "lwave": True,
-        "nsw": 0,
-    }
     return base_fn(
         atoms,
         preset=preset,
-        calc_defaults=calc_defaults,
+        calc_defaults=_STATIC_DEFAULTS,
         calc_swaps=calc_kwargs,
         additional_fields={"name": "QMOF Static"},
-        copy_files=["WAVECAR"],
+        copy_files=copy_files,
     )
@@ -66,8 +66,9 @@ def run_calc(
         The updated Atoms object.
     """
 
-    # Copy atoms so we don't modify it in-place
-    atoms = copy_atoms(atoms)
+    # Copy atoms so we don't modify it in-place. The calculator is only
+    # shallow-copied, which avoids traversing its internal state.
+    atoms = copy_atoms(atoms, deep_copy_calc=False)
 
     # Perform staging operations
     tmpdir, job_results_dir = calc_setup(copy_files=copy_files)
@@ -1,17 +1,40 @@
 """Prepration for runners"""
 from __future__ import annotations
 
+import logging
 import os
+import subprocess
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
+from gzip import GzipFile
 from pathlib import Path
-from shutil import rmtree
+from shutil import copyfileobj, copystat, move, rmtree, which
 from tempfile import mkdtemp
+from typing import TYPE_CHECKING
 
-from monty.shutil import copy_r, gzip_dir
+from monty.shutil import copy_r
 
 from quacc import SETTINGS
 from quacc.utils.files import copy_decompress, make_unique_dir
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Compression level for gzipped files. Level 3 takes roughly half the CPU time
+# of the default level with only slightly larger files.
+_GZIP_COMPRESSLEVEL = 3
+
+# Buffer size for streaming files through the gzip module
+_GZIP_CHUNK_SIZE = 1 << 20
+
+# Files whose gzipping has been deferred by `defer_gzip`. None if not active.
+_DEFERRED_GZIP_FILES: ContextVar[set[Path] | None] = ContextVar(
+    "_DEFERRED_GZIP_FILES", default=None
+)
+
 
 def calc_setup(copy_files: list[str | Path] | None = None) -> tuple[Path, Path]:
     """
@@ -86,12 +109,24 @@ def calc_cleanup(tmpdir: str | Path, job_results_dir: str | Path) -> None:
     # Change to the results directory
     os.chdir(job_results_dir)
 
-    # Gzip files in tmpdir
+    # Gzip files in tmpdir, unless this has been deferred
     if SETTINGS.GZIP_FILES:
-        gzip_dir(tmpdir)
+        deferred_files = _DEFERRED_GZIP_FILES.get()
+        if deferred_files is None:
+            _gzip_files(f for f in Path(tmpdir).rglob("*") if f.is_file())
+        else:
+            deferred_files.update(
+                Path(job_results_dir, f.relative_to(tmpdir))
+                for f in Path(tmpdir).rglob("*")
+                if f.is_file()
+            )
 
-    # Copy files back to job_results_dir
-    copy_r(tmpdir, job_results_dir)
+    # Copy files back to job_results_dir. If both are on the same filesystem,
+    # we can simply move the files since the tmpdir is removed afterwards.
+    if Path(tmpdir).stat().st_dev == Path(job_results_dir).stat().st_dev:
+        _move_r(tmpdir, job_results_dir)
+    else:
+        copy_r(tmpdir, job_results_dir)
 
     # Remove symlink to tmpdir
     symlink_path = job_results_dir / f"{tmpdir.name}-symlink"
@@ -99,3 +134,128 @@ def calc_cleanup(tmpdir: str | Path, job_results_dir: str | Path) -> None:
 
     # Remove the tmpdir
     rmtree(tmpdir, ignore_errors=True)
+
+
+@contextmanager
+def defer_gzip() -> Iterator[None]:
+    """
+    Context manager that defers the gzipping of files produced by calculations
+    run within it until the context is exited. This is useful for multi-step
+    workflows where large restart files (e.g. a WAVECAR) are handed from one
+    calculation to the next, since they would otherwise be compressed and
+    decompressed at every step. Nested usage is a no-op.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    """
+
+    if _DEFERRED_GZIP_FILES.get() is not None:
+        yield
+        return
+
+    deferred_files: set[Path] = set()
+    token = _DEFERRED_GZIP_FILES.set(deferred_files)
+    try:
+        yield
+    finally:
+        _DEFERRED_GZIP_FILES.reset(token)
+        _gzip_files(f for f in deferred_files if f.is_file())
+
+
+def _gzip_files(files: Iterable[Path]) -> None:
+    """
+    Gzip files in-place, skipping any that are already gzipped. If
+    `SETTINGS.GZIP_PARALLEL` is True and `pigz` is in the PATH, the files are
+    compressed in parallel with `pigz`, using the CPUs available to this process.
+    Otherwise, or if `pigz` fails, they are compressed one at a time with
+    Python's gzip module.
+
+    Parameters
+    ----------
+    files
+        The files to gzip.
+
+    Returns
+    -------
+    None
+    """
+
+    files = [f for f in files if f.suffix.lower() != ".gz"]
+    if not files:
+        return
+
+    pigz_cmd = which("pigz") if SETTINGS.GZIP_PARALLEL else None
+    if pigz_cmd:
+        try:
+            subprocess.run(
+                [
+                    pigz_cmd,
+                    "-f",
+                    f"-{_GZIP_COMPRESSLEVEL}",
+                    "-p",
+                    str(_get_n_cpus()),
+                    *map(str, files),
+                ],
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as err:
+            logger.warning(f"pigz failed, falling back to serial gzip: {err}")
+        files = [f for f in files if f.exists()]
+
+    for f in files:
+        with f.open("rb") as f_in, GzipFile(
+            f"{f}.gz", "wb", compresslevel=_GZIP_COMPRESSLEVEL
+        ) as f_out:
+            copyfileobj(f_in, f_out, length=_GZIP_CHUNK_SIZE)
+        copystat(f, f"{f}.gz")
+        f.unlink()
+
+
+def _get_n_cpus() -> int:
+    """
+    Get the number of CPUs available to this process. Unlike `os.cpu_count`,
+    this respects the CPU affinity set by schedulers on shared nodes.
+
+    Returns
+    -------
+    int
+        The number of available CPUs.
+    """
+
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _move_r(src: Path, dst: Path) -> None:
+    """
+    Recursively move the contents of `src` to `dst`, overwriting any existing
+    files. This is the move-based analogue of `monty.shutil.copy_r`. Each file is
+    moved with `shutil.move`, which only involves metadata operations when
+    possible and otherwise falls back to a copy (e.g. for bind mounts that share
+    a filesystem but not a mount point).
+
+    Parameters
+    ----------
+    src
+        The source directory.
+    dst
+        The destination directory.
+
+    Returns
+    -------
+    None
+    """
+
+    for f in list(Path(src).rglob("*")):
+        dst_file = Path(dst, f.relative_to(src))
+        if f.is_dir() and not f.is_symlink():
+            dst_file.mkdir(parents=True, exist_ok=True)
+        else:
+            dst_file.parent.mkdir(parents=True, exist_ok=True)
+            move(f, dst_file)
@@ -90,6 +90,13 @@ class QuaccSettings(BaseSettings):
     GZIP_FILES: bool = Field(
         True, description="Whether generated files should be gzip'd."
     )
+    GZIP_PARALLEL: bool = Field(
+        True,
+        description=(
+            "Whether generated files should be gzip'd in parallel with pigz. "
+            "Falls back to serial compression if pigz is not in PATH."
+        ),
+    )
     CHECK_CONVERGENCE: bool = Field(
         True,
         description="Whether to check for convergence in the `summarize_run`-type functions, if supported.",
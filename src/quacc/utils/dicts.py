@@ -1,6 +1,7 @@
 """Utility functions for dealing with dictionaries."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -8,13 +9,15 @@ if TYPE_CHECKING:
 
 
 def merge_dicts(
-    dict1: dict[str, Any] | None,
-    dict2: dict[str, Any] | None,
+    dict1: Mapping[str, Any] | None,
+    dict2: Mapping[str, Any] | None,
     remove_nones: bool = True,
 ) -> dict[str, Any]:
     """
     Recursively merges two dictionaries. If one of the inputs is `None`, then it is
-    treated as `{}`.
+    treated as `{}`. Neither input is modified, so read-only mappings (e.g.
+    `types.MappingProxyType`) are also supported. Nested mappings are copied into
+    new dictionaries, so the merged dictionary never shares them with the inputs.
 
     This function should be used instead of the | operator when merging nested dictionaries,
     e.g. `{"a": {"b": 1}} | {"a": {"c": 2}}` will return `{"a": {"c": 2}}` whereas
@@ -36,16 +39,14 @@ def merge_dicts(
     """
     dict1 = dict1 or {}
     dict2 = dict2 or {}
-    merged = dict1.copy()
+    merged = {k: _copy_nested(v) for k, v in dict1.items()}
 
     for key, value in dict2.items():
-        if key in merged:
-            if isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = merge_dicts(merged[key], value)
-            else:
-                merged[key] = value
+        merged_value = merged.get(key)
+        if isinstance(value, Mapping) and isinstance(merged_value, dict):
+            merged[key] = merge_dicts(merged_value, value)
         else:
-            merged[key] = value
+            merged[key] = _copy_nested(value)
 
     if remove_nones:
         merged = remove_dict_nones(merged)
@@ -53,6 +54,26 @@ def merge_dicts(
     return merged
 
 
+def _copy_nested(value: Any) -> Any:
+    """
+    Recursively copy any (possibly read-only) mappings into new dictionaries.
+
+    Parameters
+    ----------
+    value
+        Value to copy
+
+    Returns
+    -------
+    Any
+        The value, with any nested mappings copied into new dictionaries
+    """
+
+    if isinstance(value, Mapping):
+        return {k: _copy_nested(v) for k, v in value.items()}
+    return value
+
+
 def merge_several_dicts(*args, remove_nones: bool = True) -> dict[str, Any]:
     """
     Recursively merge several dictionaries, taking the latter in the list as higher preference.
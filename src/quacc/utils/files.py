@@ -16,6 +16,12 @@ from monty.io import zopen
 from monty.os.path import zpath
 from monty.shutil import decompress_file
 
+try:
+    # The LibYAML-based loader is considerably faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 if TYPE_CHECKING:
     from typing import Any
 
@@ -118,7 +124,7 @@ def load_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
 
     # Load YAML file
     with yaml_path.open() as stream:
-        config = yaml.safe_load(stream)
+        config = yaml.load(stream, Loader=SafeLoader)
 
     # Inherit arguments from any parent YAML files but do not overwrite those in
     # the child file.
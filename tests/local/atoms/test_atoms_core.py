@@ -6,9 +6,15 @@ import pytest
 from ase import Atoms
 from ase.atoms import Atoms
 from ase.build import bulk, molecule
+from ase.calculators.emt import EMT
 from ase.io import read
 
-from quacc.atoms.core import check_charge_and_spin, check_is_metal, get_atoms_id
+from quacc.atoms.core import (
+    check_charge_and_spin,
+    check_is_metal,
+    copy_atoms,
+    get_atoms_id,
+)
 from quacc.calculators.vasp import Vasp
 from quacc.schemas.prep import prep_next_run
 
@@ -56,6 +62,46 @@ def test_get_atoms_id():
     assert get_atoms_id(atoms) == md5maghash
 
 
+def test_copy_atoms():
+    atoms = bulk("Cu") * (2, 1, 1)
+    atoms[0].position += 0.1
+    atoms.calc = EMT()
+    atoms.get_potential_energy()
+
+    new_atoms = copy_atoms(atoms, deep_copy_calc=False)
+    assert new_atoms == atoms
+    assert new_atoms is not atoms
+    assert new_atoms.calc is not atoms.calc
+    assert new_atoms.calc.results.keys() == atoms.calc.results.keys()
+    assert new_atoms.calc.results["energy"] == atoms.calc.results["energy"]
+    assert new_atoms.calc.results is not atoms.calc.results
+    assert new_atoms.calc.parameters is not atoms.calc.parameters
+
+    new_atoms.calc.results.clear()
+    assert atoms.calc.results
+
+    forces = atoms.get_forces().copy()
+    new_atoms[0].position += 0.1
+    assert not np.allclose(new_atoms.get_forces(), forces)
+    assert np.array_equal(atoms.calc.results["forces"], forces)
+
+    atoms = bulk("Cu")
+    assert copy_atoms(atoms, deep_copy_calc=False).calc is None
+
+    atoms = bulk("Cu")
+    atoms.calc = Vasp(atoms, encut=400)
+    new_atoms = copy_atoms(atoms, deep_copy_calc=False)
+    new_atoms.calc.set(encut=500)
+    assert new_atoms.calc.float_params["encut"] == 500
+    assert atoms.calc.float_params["encut"] == 400
+
+    atoms.calc.results = {"forces": np.zeros((1, 3))}
+    new_atoms = copy_atoms(atoms, deep_copy_calc=False)
+    assert new_atoms.calc.input_atoms is atoms.calc.input_atoms
+    new_atoms.calc.results["forces"][:] = 1.0
+    assert np.array_equal(atoms.calc.results["forces"], np.zeros((1, 3)))
+
+
 def test_prep_next_run(
     atoms_mag, atoms_nomag, atoms_nospin
 ):  # sourcery skip: extract-duplicate-method
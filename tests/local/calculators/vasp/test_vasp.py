@@ -9,9 +9,13 @@ from ase.calculators.singlepoint import SinglePointDFTCalculator
 from ase.calculators.vasp import Vasp as Vasp_
 from ase.constraints import FixAtoms, FixBondLength
 from ase.io import read
+from pymatgen.io.ase import AseAtomsAdaptor
+from pymatgen.io.vasp.inputs import Kpoints
 
 from quacc import SETTINGS
 from quacc.calculators.vasp import Vasp, presets
+from quacc.calculators.vasp.io import load_vasp_yaml_calc
+from quacc.calculators.vasp.params import _automatic_density
 from quacc.schemas.prep import prep_next_run
 
 FILE_DIR = Path(__file__).parent
@@ -83,6 +87,38 @@ def test_presets():
     assert calc.exp_params["ediff"] == 1e-5
 
 
+def test_preset_cache():
+    default_calcs_dir = Path(presets.__file__).resolve().parent
+
+    config1 = load_vasp_yaml_calc(default_calcs_dir / "BulkSet")
+    config1["inputs"]["setups"]["Cu"] = "_bad"
+    config2 = load_vasp_yaml_calc(default_calcs_dir / "BulkSet")
+    assert config2["inputs"]["setups"]["Cu"] != "_bad"
+    assert config2 == load_vasp_yaml_calc(default_calcs_dir / "BulkSet")
+
+
+def test_preset_cache_parent(tmp_path, monkeypatch):
+    (tmp_path / "child.yaml").write_text("inputs:\n  encut: 400\nparent: parent\n")
+    (tmp_path / "parent.yaml").write_text("inputs:\n  ediff: 1.0e-5\n")
+    assert load_vasp_yaml_calc(tmp_path / "child")["inputs"]["ediff"] == 1e-5
+
+    # Editing a parent YAML invalidates the cached child
+    parent_path = tmp_path / "parent.yaml"
+    parent_path.write_text("inputs:\n  ediff: 1.0e-6\n")
+    mtime = parent_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(parent_path, ns=(mtime, mtime))
+    assert load_vasp_yaml_calc(tmp_path / "child")["inputs"]["ediff"] == 1e-6
+
+    # Relative paths are resolved against the current working directory
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    (other_dir / "child.yaml").write_text("inputs:\n  encut: 500\n")
+    monkeypatch.chdir(tmp_path)
+    assert load_vasp_yaml_calc("child")["inputs"]["encut"] == 400
+    monkeypatch.chdir(other_dir)
+    assert load_vasp_yaml_calc("child")["inputs"]["encut"] == 500
+
+
 def test_lmaxmix():
     atoms = bulk("Cu")
     calc = Vasp(atoms)
@@ -691,6 +727,38 @@ def test_kpoint_schemes():
     )
 
 
+def test_automatic_density():
+    for atoms, kppa in [
+        (bulk("Cu"), 1000),
+        (bulk("Cu", cubic=True), 1000),
+        (bulk("Cu", cubic=True), 64),
+        (bulk("Mg"), 500),
+        (bulk("Fe", cubic=True), 500),
+        (bulk("NaCl", "rocksalt", a=5.64) * (2, 1, 1), 100),
+    ]:
+        struct = AseAtomsAdaptor.get_structure(atoms)
+        for force_gamma in [False, True]:
+            ref = Kpoints.automatic_density(struct, kppa, force_gamma=force_gamma)
+            kpts = _automatic_density(struct, kppa, force_gamma=force_gamma)
+            assert kpts.kpts == ref.kpts
+            assert kpts.style == ref.style
+
+
+def test_gamma_cmd():
+    atoms = bulk("Cu")
+    calc = Vasp(atoms, kpts=[1, 1, 1], use_custodian=False)
+    assert calc.command.endswith(SETTINGS.VASP_GAMMA_CMD)
+
+    calc = Vasp(atoms, kpts=np.array([1, 1, 1]), use_custodian=False)
+    assert calc.command.endswith(SETTINGS.VASP_GAMMA_CMD)
+
+    calc = Vasp(atoms, kpts=[2, 2, 1], use_custodian=False)
+    assert calc.command.endswith(SETTINGS.VASP_CMD)
+
+    calc = Vasp(atoms, kpts=[[1.0, 1.0, 1.0]], reciprocal=True, use_custodian=False)
+    assert calc.command.endswith(SETTINGS.VASP_CMD)
+
+
 def test_constraints():
     atoms = bulk("Cu")
     atoms.set_constraint(FixAtoms(indices=[0]))
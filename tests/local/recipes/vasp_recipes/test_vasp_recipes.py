@@ -4,7 +4,7 @@ from ase.build import bulk, molecule
 from quacc import SETTINGS
 from quacc.recipes.vasp.core import double_relax_job, relax_job, static_job
 from quacc.recipes.vasp.mp import mp_prerelax_job, mp_relax_flow, mp_relax_job
-from quacc.recipes.vasp.qmof import qmof_relax_job
+from quacc.recipes.vasp.qmof import qmof_relax_flow, qmof_relax_job
 from quacc.recipes.vasp.slabs import (
     bulk_to_slabs_flow,
     slab_relax_job,
@@ -354,6 +354,30 @@ def test_qmof(tmp_path, monkeypatch):
     output = qmof_relax_job(atoms)
 
 
+def test_qmof_flow(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    atoms = bulk("Cu")
+    output = qmof_relax_flow(atoms)
+    assert output["prerelax_lowacc"]["nsites"] == len(atoms)
+    assert output["prerelax_lowacc"]["parameters"]["nsw"] == 0
+    assert output["position_relax_lowacc"]["parameters"]["isif"] == 2
+    assert output["volume_relax_lowacc"]["parameters"]["isif"] == 3
+    assert output["double_relax"][0]["parameters"]["isif"] == 3
+    assert output["double_relax"][0]["parameters"]["lreal"] == "auto"
+    assert output["double_relax"][1]["parameters"]["isif"] == 3
+    assert output["double_relax"][1]["parameters"]["lreal"] is False
+    assert output["nsites"] == len(atoms)
+    assert output["parameters"]["nsw"] == 0
+    assert output["parameters"]["laechg"] is True
+
+    output = qmof_relax_flow(atoms, relax_cell=False, run_prerelax=False)
+    assert output["prerelax_lowacc"] is None
+    assert output["volume_relax_lowacc"] is None
+    assert output["double_relax"][0]["parameters"]["isif"] == 2
+    assert output["double_relax"][1]["parameters"]["isif"] == 2
+
+
 def test_mp_prerelax_job(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
@@ -1,5 +1,7 @@
+import errno
 import os
-from shutil import rmtree
+from pathlib import Path
+from shutil import rmtree, which
 
 import numpy as np
 import pytest
@@ -10,6 +12,7 @@ from ase.optimize import BFGS, BFGSLineSearch
 
 from quacc import SETTINGS
 from quacc.runners.ase import run_calc, run_opt, run_vib
+from quacc.runners.prep import calc_cleanup, calc_setup, defer_gzip
 
 DEFAULT_SETTINGS = SETTINGS.model_copy()
 
@@ -47,6 +50,20 @@ def test_run_calc(tmp_path, monkeypatch):
     assert np.array_equal(new_atoms.cell.array, atoms.cell.array) is True
 
 
+def test_run_calc_does_not_modify_input(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    atoms = bulk("Cu") * (2, 1, 1)
+    atoms[0].position += 0.1
+    atoms.calc = EMT()
+    forces = atoms.get_forces().copy()
+
+    atoms[0].position += 0.2
+    new_atoms = run_calc(atoms)
+    assert not np.allclose(new_atoms.calc.results["forces"], forces)
+    assert np.array_equal(atoms.calc.results["forces"], forces)
+
+
 def test_run_calc_no_gzip(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     prep_files()
@@ -67,6 +84,121 @@ def test_run_calc_no_gzip(tmp_path, monkeypatch):
     SETTINGS.GZIP_FILES = DEFAULT_SETTINGS.GZIP_FILES
 
 
+def test_run_calc_pigz(tmp_path, monkeypatch):
+    if not which("gzip"):
+        pytest.skip("gzip is not available")
+
+    # Stand-in for pigz, which takes the same arguments as gzip
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake_pigz = bin_dir / "pigz"
+    fake_pigz.write_text('#!/bin/sh\necho "$@" > pigz_args.txt\nexec gzip "$@"\n')
+    fake_pigz.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    monkeypatch.chdir(tmp_path)
+    prep_files()
+
+    atoms = bulk("Cu") * (2, 1, 1)
+    atoms[0].position += 0.1
+    atoms.calc = EMT()
+
+    new_atoms = run_calc(atoms, copy_files=["test_file.txt"])
+    assert new_atoms.calc.results is not None
+    assert not os.path.exists(os.path.join(SETTINGS.RESULTS_DIR, "test_file.txt"))
+    assert os.path.exists(os.path.join(SETTINGS.RESULTS_DIR, "test_file.txt.gz"))
+    pigz_args = Path(SETTINGS.RESULTS_DIR, "pigz_args.txt").read_text().split()
+    assert pigz_args[:2] == ["-f", "-3"]
+    assert pigz_args[2] == "-p"
+    assert int(pigz_args[3]) >= 1
+    os.remove(os.path.join(SETTINGS.RESULTS_DIR, "pigz_args.txt"))
+
+
+def test_run_calc_pigz_fails(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake_pigz = bin_dir / "pigz"
+    fake_pigz.write_text("#!/bin/sh\nexit 1\n")
+    fake_pigz.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    monkeypatch.chdir(tmp_path)
+    prep_files()
+
+    atoms = bulk("Cu") * (2, 1, 1)
+    atoms[0].position += 0.1
+    atoms.calc = EMT()
+
+    new_atoms = run_calc(atoms, copy_files=["test_file.txt"])
+    assert new_atoms.calc.results is not None
+    assert not os.path.exists(os.path.join(SETTINGS.RESULTS_DIR, "test_file.txt"))
+    assert os.path.exists(os.path.join(SETTINGS.RESULTS_DIR, "test_file.txt.gz"))
+
+
+def test_run_calc_defer_gzip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    prep_files()
+
+    atoms = bulk("Cu") * (2, 1, 1)
+    atoms[0].position += 0.1
+    atoms.calc = EMT()
+
+    with defer_gzip():
+        new_atoms = run_calc(atoms, copy_files=["test_file.txt"])
+        assert os.path.exists(os.path.join(SETTINGS.RESULTS_DIR, "test_file.txt"))
+        assert not os.path.exists(
+            os.path.join(SETTINGS.RESULTS_DIR, "test_file.txt.gz")
+        )
+        new_atoms = run_calc(new_atoms, copy_files=["test_file.txt"])
+    assert new_atoms.calc.results is not None
+    assert not os.path.exists(os.path.join(SETTINGS.RESULTS_DIR, "test_file.txt"))
+    assert os.path.exists(os.path.join(SETTINGS.RESULTS_DIR, "test_file.txt.gz"))
+
+
+def test_calc_cleanup_nested(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    SETTINGS.GZIP_FILES = False
+
+    tmpdir, job_results_dir = calc_setup()
+    (tmpdir / "subdir").mkdir()
+    (tmpdir / "subdir" / "nested.txt").write_text("nested")
+    (tmpdir / "top.txt").write_text("top")
+    calc_cleanup(tmpdir, job_results_dir)
+
+    assert not tmpdir.exists()
+    assert (job_results_dir / "top.txt").read_text() == "top"
+    assert (job_results_dir / "subdir" / "nested.txt").read_text() == "nested"
+    os.remove(job_results_dir / "top.txt")
+    rmtree(job_results_dir / "subdir")
+    SETTINGS.GZIP_FILES = DEFAULT_SETTINGS.GZIP_FILES
+
+
+def test_calc_cleanup_cross_mount(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    SETTINGS.GZIP_FILES = False
+
+    tmpdir, job_results_dir = calc_setup()
+    (tmpdir / "empty").mkdir()
+    (tmpdir / "subdir").mkdir()
+    (tmpdir / "subdir" / "nested.txt").write_text("nested")
+
+    # Mimic a bind mount, where rename(2) fails despite a shared st_dev
+    def rename(*args, **kwargs):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+    with monkeypatch.context() as m:
+        m.setattr(os, "rename", rename)
+        m.setattr(os, "replace", rename)
+        calc_cleanup(tmpdir, job_results_dir)
+
+    assert not tmpdir.exists()
+    assert (job_results_dir / "empty").is_dir()
+    assert (job_results_dir / "subdir" / "nested.txt").read_text() == "nested"
+    rmtree(job_results_dir / "empty")
+    rmtree(job_results_dir / "subdir")
+    SETTINGS.GZIP_FILES = DEFAULT_SETTINGS.GZIP_FILES
+
+
 def test_run_opt1(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     prep_files()
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from quacc.utils.dicts import merge_dicts, remove_dict_nones
 
 
@@ -28,3 +30,38 @@ def test_merge_dicts():
         "b": {"a": 1, "b": 3, "d": 1},
         "c": 3,
     }
+
+
+def test_merge_dicts_keep_nones():
+    defaults = {"a": 1, "b": {"a": 1, "b": 2}, "c": 3}
+    calc_swaps = {"a": None, "d": 4}
+    assert merge_dicts(defaults, calc_swaps, remove_nones=False) == {
+        "a": None,
+        "b": {"a": 1, "b": 2},
+        "c": 3,
+        "d": 4,
+    }
+    assert merge_dicts(defaults, calc_swaps) == {"b": {"a": 1, "b": 2}, "c": 3, "d": 4}
+
+
+def test_merge_dicts_read_only():
+    defaults = MappingProxyType({"a": 1, "b": {"a": 1, "b": 2}})
+    calc_swaps = {"c": 3, "b": {"b": 3, "d": 1}}
+    merged = merge_dicts(defaults, calc_swaps)
+    assert merged == {"a": 1, "b": {"a": 1, "b": 3, "d": 1}, "c": 3}
+    assert isinstance(merged, dict)
+    assert defaults == {"a": 1, "b": {"a": 1, "b": 2}}
+
+
+def test_merge_dicts_copies_nested():
+    defaults = MappingProxyType({"a": {"b": 1}, "c": {"d": 2}})
+    calc_swaps = {"c": {"e": 3}, "f": {"g": 4}}
+    merged = merge_dicts(defaults, calc_swaps, remove_nones=False)
+    assert merged == {"a": {"b": 1}, "c": {"d": 2, "e": 3}, "f": {"g": 4}}
+    assert merged["a"] is not defaults["a"]
+    assert merged["f"] is not calc_swaps["f"]
+
+    merged["a"]["b"] = 5
+    merged["f"]["g"] = 5
+    assert defaults["a"] == {"b": 1}
+    assert calc_swaps["f"] == {"g": 4}
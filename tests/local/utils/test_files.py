@@ -1,6 +1,9 @@
 import os
 
-from quacc.utils.files import make_unique_dir
+import yaml
+
+from quacc import SETTINGS
+from quacc.utils.files import load_yaml_calc, make_unique_dir
 
 
 def test_make_unique_dir(tmp_path, monkeypatch):
@@ -13,3 +16,10 @@ def test_make_unique_dir(tmp_path, monkeypatch):
     assert os.path.exists("tmp_dir")
     assert "tmp_dir" in str(jobdir)
     assert os.path.exists(jobdir)
+
+
+def test_load_yaml_calc():
+    yaml_path = SETTINGS.VASP_PRESET_DIR / "setups_pbe54.yaml"
+    with yaml_path.open() as stream:
+        ref = yaml.safe_load(stream)
+    assert load_yaml_calc(yaml_path) == ref